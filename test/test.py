@@ -12,5 +12,12 @@ async def main(ssid: str):
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     ssid = input("Please enter your ssid: ")
     asyncio.run(main(ssid))
\ No newline at end of file
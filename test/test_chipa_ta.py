@@ -1,4 +1,3 @@
-import json
 from chipa_ta import Candle, Indicator
 
 raw_candles = [
@@ -15,15 +14,21 @@ atr = Indicator.atr(3)
 
 print("Feeding candles...")
 
-for raw in raw_candles:
-    candle = Candle.from_json(json.dumps(raw))
+candles = [
+    Candle(raw["close"], raw["high"], raw["low"], raw["open"], raw["close"], raw["volume"])
+    for raw in raw_candles
+]
 
-    sma_val = sma.next_candle(candle)
-    ema_val = ema.next_candle(candle)
-    macd_val = macd.next_candle(candle)
-    rsi_val = rsi.next_candle(candle)
-    atr_val = atr.next_candle(candle)
+# One call per indicator for the whole batch; state is kept between candles.
+sma_vals = sma.next_candles(candles)
+ema_vals = ema.next_candles(candles)
+macd_vals = macd.next_candles(candles)
+rsi_vals = rsi.next_candles(candles)
+atr_vals = atr.next_candles(candles)
 
+for candle, sma_val, ema_val, macd_val, rsi_val, atr_val in zip(
+    candles, sma_vals, ema_vals, macd_vals, rsi_vals, atr_vals
+):
     print(f"Candle close: {candle.close:.4f}")
     print(f"sma = {sma_val}")
     print(f"ema = {ema_val}")